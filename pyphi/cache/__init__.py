@@ -2,14 +2,16 @@
 """Memoization and caching utilities."""
 
 import os
-from functools import update_wrapper, wraps
+import weakref
+from collections import OrderedDict
+from functools import lru_cache, update_wrapper
 
 import psutil
 
 from .. import constants
 from ..conf import config
 
-from .cache_utils import _make_key, _CacheInfo
+from .cache_utils import _make_key_typed, _make_key_untyped, _CacheInfo
 
 import joblib
 
@@ -17,6 +19,45 @@ import joblib
 joblib_memory = joblib.Memory(location=constants.DISK_CACHE_LOCATION, verbose=0)
 
 
+def two_tier_memory(maxsize=128):
+    """Two-tier (memory + disk) cache decorator.
+
+    Results are persisted to disk with ``joblib_memory``, while an in-process
+    LRU holds the most recently used results so that repeated hits in the same
+    process skip the disk read and unpickling round-trip entirely.
+
+    Arguments to the cached function must be hashable.
+
+    Keyword Args:
+        maxsize (int): Maximum number of deserialized results to keep in
+            memory.
+    """
+
+    def decorator(user_function):
+        disk_function = joblib_memory.cache(user_function)
+
+        @lru_cache(maxsize=maxsize)
+        def wrapper(*args, **kwargs):
+            return disk_function(*args, **kwargs)
+
+        return update_wrapper(wrapper, user_function)
+
+    return decorator
+
+
+def _light_update(wrapper, wrapped):
+    """Copy only the attributes needed to identify the wrapped function.
+
+    ``functools.update_wrapper`` copies seven attributes and merges
+    ``__dict__``; for private wrappers that is wasted work, so copy just the
+    name and the reference to the original function.
+    """
+    wrapper.__name__ = wrapped.__name__
+    wrapper.__qualname__ = wrapped.__qualname__
+    wrapper.__wrapped__ = wrapped
+    return wrapper
+
+
 def cache(cache={}, maxmem=config.MAXIMUM_CACHE_MEMORY_PERCENTAGE, typed=False):
     """Memory-limited cache decorator.
 
@@ -33,83 +74,115 @@ def cache(cache={}, maxmem=config.MAXIMUM_CACHE_MEMORY_PERCENTAGE, typed=False):
     with f.cache_info(). Clear the cache and statistics with f.cache_clear().
     Access the underlying function with f.__wrapped__.
     """
-    # Constants shared by all lru cache instances:
-    # Unique object used to signal cache misses.
-    sentinel = object()
-    # Build a key from the function arguments.
-    make_key = _make_key
-
-    def decorating_function(user_function, hits=0, misses=0):
-        full = False
-        # Bound method to look up a key or return None.
-        cache_get = cache.get
+    # Build a key from the function arguments; the key builder is chosen at
+    # decoration time so the wrappers never branch on `typed`.
+    make_key = _make_key_typed if typed else _make_key_untyped
+
+    def decorating_function(user_function):
+        # Mutable [hits, misses, full] statistics, shared by reference so the
+        # wrappers can update them with in-place indexing rather than cell
+        # rebinding via ``nonlocal``.
+        _stats = [0, 0, False]
+        # Sample memory usage from a single Process object rather than
+        # constructing one (and re-reading total system memory) on every miss.
+        _proc = psutil.Process(os.getpid())
+        _total_mem = psutil.virtual_memory().total
 
         if not maxmem:
 
             def wrapper(*args, **kwds):
-                # Simple caching without memory limit.
-                nonlocal hits, misses
-                key = make_key(args, kwds, typed)
-                result = cache_get(key, sentinel)
-                if result is not sentinel:
-                    hits += 1
+                # Simple caching without memory limit. A hit is a single
+                # C-level dict lookup; misses pay for the raised KeyError.
+                key = make_key(args, kwds)
+                try:
+                    result = cache[key]
+                    _stats[0] += 1
                     return result
+                except KeyError:
+                    pass
                 result = user_function(*args, **kwds)
                 cache[key] = result
-                misses += 1
+                _stats[1] += 1
                 return result
 
         else:
 
             def wrapper(*args, **kwds):
                 # Memory-limited caching.
-                nonlocal hits, misses, full
-                key = make_key(args, kwds, typed)
-                result = cache_get(key)
-                if result is not None:
-                    hits += 1
+                key = make_key(args, kwds)
+                try:
+                    result = cache[key]
+                    _stats[0] += 1
                     return result
+                except KeyError:
+                    pass
                 result = user_function(*args, **kwds)
-                if not full:
+                if not _stats[2]:
                     cache[key] = result
                     # Cache is full if the total recursive usage is greater
-                    # than the maximum allowed percentage.
-                    current_process = psutil.Process(os.getpid())
-                    full = current_process.memory_percent() > maxmem
-                misses += 1
+                    # than the maximum allowed percentage. Since sampling
+                    # memory usage is a syscall, only check periodically.
+                    if (_stats[1] & 0xFFF) == 0:
+                        _stats[2] = (
+                            100 * _proc.memory_info().rss / _total_mem > maxmem
+                        )
+                _stats[1] += 1
                 return result
 
         def cache_info():
             """Report cache statistics."""
-            return _CacheInfo(hits, misses, len(cache))
+            return _CacheInfo(_stats[0], _stats[1], len(cache))
 
         def cache_clear():
             """Clear the cache and cache statistics."""
-            nonlocal hits, misses, full
             cache.clear()
-            hits = misses = 0
-            full = False
+            _stats[0] = _stats[1] = 0
+            _stats[2] = False
 
         wrapper.cache_info = cache_info
         wrapper.cache_clear = cache_clear
-        return update_wrapper(wrapper, user_function)
+        return _light_update(wrapper, user_function)
 
     return decorating_function
 
 
+def _pack_indices(indices):
+    """Pack a frozenset of node indices into an integer bitmask.
+
+    The packing is injective for non-negative integers, so distinct index
+    sets never collide. Frozensets containing anything else are returned
+    unchanged.
+    """
+    mask = 0
+    try:
+        for i in indices:
+            mask |= 1 << i
+        return mask
+    except (TypeError, ValueError):
+        return indices
+
+
 class DictCache:
     """A generic dictionary-based cache.
 
-    Intended to be used as an object-level cache of method results.
+    Intended to be used as an object-level cache of method results. The
+    backing store is a bounded LRU mapping: when the cache grows past
+    ``maxsize`` entries, the least recently used entry is evicted, so
+    long-running computations cannot accumulate an unbounded working set.
     """
 
-    def __init__(self):
-        self.cache = {}
+    __slots__ = ("cache", "hits", "misses", "maxsize")
+
+    def __init__(self, maxsize=None):
+        if maxsize is None:
+            maxsize = config.MAXIMUM_DICT_CACHE_SIZE
+        self.maxsize = maxsize
+        self.cache = OrderedDict()
         self.hits = 0
         self.misses = 0
 
     def clear(self):
-        self.cache = {}
+        self.cache = OrderedDict()
         self.hits = 0
         self.misses = 0
 
@@ -127,27 +200,39 @@ class DictCache:
         Returns None if the key is not in the cache. Updates cache
         statistics.
         """
-        if key in self.cache:
-            self.hits += 1
-            return self.cache[key]
-        self.misses += 1
-        return None
+        try:
+            value = self.cache[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        self.cache.move_to_end(key)
+        self.hits += 1
+        return value
 
     def set(self, key, value):
-        """Set a value in the cache"""
+        """Set a value in the cache, evicting the least recently used entry
+        if the cache is full."""
         self.cache[key] = value
+        if len(self.cache) > self.maxsize:
+            self.cache.popitem(last=False)
 
     # TODO: handle **kwarg keys if needed
     # See joblib.func_inspect.filter_args
     def key(self, *args, _prefix=None, **kwargs):
         """Get the cache key for the given function args.
 
+        Frozensets of node indices (mechanisms, purviews) are packed into
+        integer bitmasks, which hash as a single C-level integer rather than
+        element by element.
+
         Kwargs:
            prefix: A constant to prefix to the key.
         """
         if kwargs:
             raise NotImplementedError("kwarg cache keys not implemented")
-        return (_prefix,) + tuple(args)
+        return (_prefix,) + tuple(
+            _pack_indices(arg) if type(arg) is frozenset else arg for arg in args
+        )
 
 
 def validate_parent_cache(parent_cache):
@@ -160,10 +245,95 @@ def validate_parent_cache(parent_cache):
 class PurviewCache(DictCache):
     """A network-level cache for possible purviews."""
 
+    __slots__ = ()
+
     def set(self, key, value):
         """Only set if purview caching is enabled"""
         if config.CACHE_POTENTIAL_PURVIEWS:
-            self.cache[key] = value
+            super().set(key, value)
+
+
+class CachedMethod:
+    """Descriptor implementing an object-level method cache.
+
+    On first access through an instance, a wrapper bound to that instance's
+    cache is built and memoized, so subsequent calls skip the per-call
+    attribute lookup of the cache object and its methods.
+    """
+
+    def __init__(self, func, cache_name, key_prefix=None):
+        self.func = func
+        self.cache_name = cache_name
+        self.key_prefix = key_prefix
+        # Bound wrappers, keyed by instance id. Entries (and the strong
+        # references they hold to the instance's cache) are dropped when the
+        # instance is garbage-collected.
+        self._bound = {}
+        update_wrapper(self, func)
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        obj_id = id(obj)
+        try:
+            return self._bound[obj_id]
+        except KeyError:
+            pass
+
+        func = self.func
+        key_prefix = self.key_prefix
+        instance_cache = getattr(obj, self.cache_name)
+        cache_key = instance_cache.key
+        cache_get = instance_cache.get
+        cache_set = instance_cache.set
+        # Hold only a weak reference to the instance so that memoizing the
+        # bound wrapper does not keep the instance alive.
+        obj_ref = weakref.ref(obj)
+
+        def wrapper(*args, **kwargs):
+            # Delegate key generation
+            key = cache_key(*args, _prefix=key_prefix, **kwargs)
+            # Get cached value, or compute
+            value = cache_get(key)
+            if value is None:  # miss
+                value = func(obj_ref(), *args, **kwargs)
+                cache_set(key, value)
+            return value
+
+        # These wrappers are created per instance, so a full update_wrapper
+        # is wasted work.
+        _light_update(wrapper, func)
+
+        try:
+            weakref.finalize(obj, self._bound.pop, obj_id, None)
+        except TypeError:
+            # Instance doesn't support weak references; don't memoize.
+            return wrapper
+        self._bound[obj_id] = wrapper
+        return wrapper
+
+
+class ConfigGatedCachedMethod:
+    """Descriptor switching between a cached and an uncached implementation
+    of a method based on a configuration option.
+
+    The option is consulted on every attribute access, so toggling it — e.g.
+    with ``config.override`` — takes effect immediately, even for existing
+    instances.
+    """
+
+    def __init__(self, option_name, func, cache_name, key_prefix=None):
+        self.option_name = option_name
+        self.func = func
+        self.cached = CachedMethod(func, cache_name, key_prefix)
+        update_wrapper(self, func)
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        if config[self.option_name]:
+            return self.cached.__get__(obj, objtype)
+        return self.func.__get__(obj, objtype)
 
 
 def method(cache_name, key_prefix=None):
@@ -180,23 +350,12 @@ def method(cache_name, key_prefix=None):
     """
 
     def decorator(func):
-        if not config.CACHE_REPERTOIRES and "repertoire" in func.__name__:
-            return func
-
-        @wraps(func)
-        def wrapper(obj, *args, **kwargs):
-            cache = getattr(obj, cache_name)
-
-            # Delegate key generation
-            key = cache.key(*args, _prefix=key_prefix, **kwargs)
-
-            # Get cached value, or compute
-            value = cache.get(key)
-            if value is None:  # miss
-                value = func(obj, *args, **kwargs)
-                cache.set(key, value)
-            return value
-
-        return wrapper
+        if "repertoire" in func.__name__:
+            # Respect CACHE_REPERTOIRES at call time rather than freezing
+            # its value when the class body is executed.
+            return ConfigGatedCachedMethod(
+                "CACHE_REPERTOIRES", func, cache_name, key_prefix
+            )
+        return CachedMethod(func, cache_name, key_prefix)
 
     return decorator
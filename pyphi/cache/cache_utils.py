@@ -3,6 +3,7 @@
 
 import os
 from collections import namedtuple
+from itertools import chain
 
 import psutil
 
@@ -11,33 +12,27 @@ from ..conf import config
 _CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "currsize"])
 
 
-def memory_full():
-    """Check if the memory is too full for further caching."""
-    current_process = psutil.Process(os.getpid())
-    return current_process.memory_percent() > config.MAXIMUM_CACHE_MEMORY_PERCENTAGE
-
+# Reuse a single Process object and total-memory sample; constructing these on
+# every check is a syscall-bound operation that dominates on hot paths.
+_current_process = psutil.Process(os.getpid())
+_total_memory = psutil.virtual_memory().total
 
-class _HashedSeq(list):
-    """This class guarantees that ``hash()`` will be called no more than once
-    per element.  This is important because the ``lru_cache()`` will hash the
-    key multiple times on a cache miss.
-    """
 
-    __slots__ = ("hashvalue",)
+def memory_full():
+    """Check if the memory is too full for further caching."""
+    return (
+        100 * _current_process.memory_info().rss / _total_memory
+        > config.MAXIMUM_CACHE_MEMORY_PERCENTAGE
+    )
 
-    def __init__(self, tup, hash=hash):
-        super().__init__()
-        self[:] = tup
-        self.hashvalue = hash(tup)
 
-    def __hash__(self):
-        return self.hashvalue
+# The key builders are specialized on ``typed`` so the decorated wrappers pay
+# no per-call branch for a flag that is fixed at decoration time.
 
 
-def _make_key(
+def _make_key_untyped(
     args,
     kwds,
-    typed,
     kwd_mark=(object(),),
     fasttypes={int, str, frozenset, type(None)},
     sorted=sorted,
@@ -45,7 +40,7 @@ def _make_key(
     type=type,
     len=len,
 ):
-    """Make a cache key from optionally typed positional and keyword arguments.
+    """Make a cache key from positional and keyword arguments.
 
     The key is constructed in a way that is flat as possible rather than as a
     nested structure that would take more memory.
@@ -54,16 +49,37 @@ def _make_key(
     hash value, then that argument is returned without a wrapper.  This saves
     space and improves lookup speed.
     """
+    # Build the key in a single concatenation; repeated ``key += item`` would
+    # copy the growing tuple on every iteration.
     key = args
     if kwds:
-        sorted_items = sorted(kwds.items())
-        key += kwd_mark
-        for item in sorted_items:
-            key += item
-    if typed:
-        key += tuple(type(v) for v in args)
-        if kwds:
-            key += tuple(type(v) for k, v in sorted_items)
+        key += kwd_mark + tuple(chain.from_iterable(sorted(kwds.items())))
     elif len(key) == 1 and type(key[0]) in fasttypes:
         return key[0]
-    return _HashedSeq(key)
+    # Return the raw tuple: tuples hash in C, and our cache wrappers hash the
+    # key at most once per get and once per set, so memoizing the hash in a
+    # wrapper object (as functools.lru_cache does) costs more than it saves.
+    return key
+
+
+def _make_key_typed(
+    args,
+    kwds,
+    kwd_mark=(object(),),
+    sorted=sorted,
+    tuple=tuple,
+    type=type,
+):
+    """Make a cache key that distinguishes arguments of different types.
+
+    For example, f(3.0) and f(3) yield distinct keys.
+    """
+    key = args
+    if kwds:
+        sorted_items = sorted(kwds.items())
+        key += kwd_mark + tuple(chain.from_iterable(sorted_items))
+        key += tuple(type(v) for v in args)
+        key += tuple(type(v) for k, v in sorted_items)
+    else:
+        key += tuple(type(v) for v in args)
+    return key
@@ -1,23 +1,35 @@
 # cache/redis.py
 """Provides a Redis backend for caching."""
 
+import io
 import pickle
 
+import numpy as np
+
 from .. import constants
 from ..conf import config
 
 from .cache_utils import _CacheInfo
 
 try:
-    import redis
+    import xxhash
+
+    def _digest(data):
+        return xxhash.xxh3_64(data).digest()
+
+except ModuleNotFoundError:
+    import hashlib
 
-    NO_REDIS = False
-except ModuleNotFoundError as exc:
-    NO_REDIS = True
+    def _digest(data):
+        return hashlib.blake2b(data, digest_size=8).digest()
 
 
 def init(db):
-    if NO_REDIS:
+    # `redis` is imported here, not at module level, so that neither the
+    # import nor the connection pool is paid for unless the cache is used.
+    try:
+        import redis
+    except ModuleNotFoundError:
         return None
     return redis.StrictRedis(
         host=config.REDIS_CONFIG["host"], port=config.REDIS_CONFIG["port"], db=db
@@ -31,22 +43,74 @@ def init(db):
 #
 # TODO(redis): rebuild connection after config changes and warn in on_change if
 # set to True
-conn = init(config.REDIS_CONFIG["db"])
+
+
+def _connect():
+    """Return the shared connection, creating it on first use.
+
+    The connection is published as the module attribute ``conn``, which stays
+    authoritative: code that reassigns ``redis.conn`` (as the test session
+    does to redirect traffic to the test db) redirects every cache operation.
+    """
+    try:
+        return globals()["conn"]
+    except KeyError:
+        globals()["conn"] = init(config.REDIS_CONFIG["db"])
+        return globals()["conn"]
+
+
+def __getattr__(name):
+    # Create the connection lazily on first attribute access (PEP 562), so
+    # importing this module opens no sockets and resolves no DNS. Once
+    # created (or assigned), ``conn`` is an ordinary module global and this
+    # hook no longer fires for it.
+    if name == "conn":
+        return _connect()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def available():
     """Check if the Redis server is connected."""
+    import redis
+
+    conn = _connect()
     try:
         return conn.ping()
     except redis.exceptions.ConnectionError:
         return False
 
 
+# Type tags distinguishing the serialization format of cached values.
+_NUMPY_TAG = b"N"
+_PICKLE_TAG = b"P"
+
+# Version tag for the key schema; bump to invalidate old keys when the
+# digesting scheme changes.
+_KEY_SCHEMA = b"\x01"
+
+
+def _digest_key(key):
+    """Digest a cache key to a short fixed-width Redis key.
+
+    Structured keys (tuples of indices, directions, etc.) serialize to long
+    strings, inflating every command sent over the Redis link. An 8-byte
+    non-cryptographic hash is adequate for cache keys and keeps commands
+    small.
+
+    .. note:: Entries cached by versions using a different key scheme are not
+        reused.
+    """
+    return _KEY_SCHEMA + _digest(
+        pickle.dumps(key, protocol=constants.PICKLE_PROTOCOL)
+    )
+
+
 # TODO: use a cache prefix?
 # TODO: key schema for easy access/queries
 class RedisCache:
     def clear(self):
         """Flush the cache."""
+        conn = _connect()
         conn.flushdb()
         conn.config_resetstat()
 
@@ -56,32 +120,66 @@ class RedisCache:
 
         .. note:: This is the size of the entire Redis database.
         """
-        return conn.dbsize()
+        return _connect().dbsize()
 
     def info(self):
         """Return cache information.
 
         .. note:: This is not the cache info for the entire Redis key space.
         """
-        info = conn.info()
+        info = _connect().info()
         return _CacheInfo(info["keyspace_hits"], info["keyspace_misses"], self.size())
 
+    @staticmethod
+    def _encode(value):
+        """Serialize a value for storage.
+
+        Numpy arrays (the common case: repertoires) use numpy's own binary
+        format, which avoids the copies made by the pickle reducer. A
+        one-byte tag records which codec was used.
+        """
+        if isinstance(value, np.ndarray):
+            buf = io.BytesIO()
+            np.lib.format.write_array(buf, value, allow_pickle=False)
+            return _NUMPY_TAG + buf.getvalue()
+        return _PICKLE_TAG + pickle.dumps(value, protocol=constants.PICKLE_PROTOCOL)
+
+    @staticmethod
+    def _decode(value):
+        """Deserialize a stored value, dispatching on its type tag."""
+        if value is None:
+            return None
+        if value[:1] == _NUMPY_TAG:
+            return np.lib.format.read_array(io.BytesIO(value[1:]))
+        return pickle.loads(value[1:])
+
     def get(self, key):
         """Get a value from the cache.
 
         Returns None if the key is not in the cache.
         """
-        value = conn.get(key)
-
-        if value is not None:
-            value = pickle.loads(value)
-
-        return value
+        return self._decode(_connect().get(_digest_key(key)))
 
     def set(self, key, value):
         """Set a value in the cache."""
-        value = pickle.dumps(value, protocol=constants.PICKLE_PROTOCOL)
-        conn.set(key, value)
+        _connect().set(_digest_key(key), self._encode(value))
+
+    def get_many(self, keys):
+        """Get multiple values from the cache in a single round-trip.
+
+        Returns a list aligned with ``keys``, with None for missing entries.
+        """
+        return [
+            self._decode(v)
+            for v in _connect().mget([_digest_key(k) for k in keys])
+        ]
+
+    def set_many(self, items):
+        """Set multiple ``(key, value)`` pairs in a single round-trip."""
+        pipe = _connect().pipeline(transaction=False)
+        for key, value in items:
+            pipe.set(_digest_key(key), self._encode(value))
+        pipe.execute()
 
     def key(self):
         """Delegate to subclasses."""
@@ -3,7 +3,7 @@
 
 import logging
 
-from .. import conf, exceptions, utils, validate
+from .. import cache, conf, exceptions, utils, validate
 from ..conf import config
 from ..models import _null_sia
 from ..subsystem import Subsystem
@@ -14,17 +14,45 @@ from .subsystem import sia
 log = logging.getLogger(__name__)
 
 
+# Memo of which subsets of a network's nodes admit a subsystem in a valid
+# state, keyed on ``(network, indices, state)``. Networks are immutable, so
+# the screening is pure in its key; repeated walks of the same lattice (e.g.
+# ``complexes`` followed by ``major_complex``) then skip constructing — and
+# discarding — subsystems in unreachable states.
+_reachable_subsets = cache.DictCache(maxsize=128)
+
+
 def reachable_subsystems(network, indices, state, **kwargs):
     """A generator over all subsystems in a valid state."""
     validate.is_network(network)
 
+    indices = tuple(indices)
+    key = None
+    if not kwargs:
+        # Extra constructor arguments (e.g. a cut) could change which states
+        # are reachable, so only consult the memo for plain subsystems.
+        key = (network, indices, state)
+        known = _reachable_subsets.get(key)
+        if known is not None:
+            for subset in known:
+                yield Subsystem(network, state, subset)
+            return
+
     # Return subsystems largest to smallest to optimize parallel
     # resource usage.
+    reachable = []
     for subset in utils.powerset(indices, nonempty=True, reverse=True):
         try:
-            yield Subsystem(network, state, subset, **kwargs)
+            subsystem = Subsystem(network, state, subset, **kwargs)
         except exceptions.StateUnreachableError:
-            pass
+            continue
+        reachable.append(subset)
+        yield subsystem
+
+    # Only record the screening if the caller exhausted the generator;
+    # otherwise we haven't seen the whole lattice.
+    if key is not None:
+        _reachable_subsets.set(key, tuple(reachable))
 
 
 def subsystems(network, state, **kwargs):
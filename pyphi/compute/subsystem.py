@@ -6,7 +6,7 @@ import logging
 
 from more_itertools import collapse
 
-from .. import conf, connectivity, utils
+from .. import cache, conf, connectivity, utils
 from ..conf import config
 from ..direction import Direction
 from ..metrics.ces import ces_distance
@@ -307,11 +307,37 @@ def _sia(subsystem, **kwargs):
     return result
 
 
+# Memo of SIA results keyed on (subsystem, configuration fingerprint). The
+# analysis is a pure function of the subsystem's value (which hashes its
+# network, nodes, state, and cut) and the current configuration, so equal
+# subsystems under an unchanged configuration share one computation.
+_sia_cache = cache.DictCache(maxsize=512)
+
+
+def _config_fingerprint():
+    """A fingerprint of the current configuration values.
+
+    Stable within a process; ``config.override`` blocks produce a different
+    fingerprint for their duration, so overridden options never alias cached
+    results computed under the ambient configuration.
+    """
+    return hash(repr(sorted(config.snapshot().items(), key=lambda item: item[0])))
+
+
 @functools.wraps(_sia)
 def sia(subsystem, **kwargs):
     if config.SYSTEM_CUTS == "CONCEPT_STYLE":
         return sia_concept_style(subsystem, **kwargs)
-    return _sia(subsystem, **kwargs)
+    if kwargs:
+        # Execution-tuning kwargs (parallelism, progress bars) don't belong in
+        # the key; skip the memo rather than risk conflating them.
+        return _sia(subsystem, **kwargs)
+    key = (subsystem, _config_fingerprint())
+    result = _sia_cache.get(key)
+    if result is None:
+        result = _sia(subsystem)
+        _sia_cache.set(key, result)
+    return result
 
 
 def phi(subsystem):
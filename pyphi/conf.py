@@ -626,6 +626,16 @@ class PyphiConfig(Config):
     reducibility checks, but uses additional memory.""",
     )
 
+    MAXIMUM_DICT_CACHE_SIZE = Option(
+        2**14,
+        type=int,
+        doc="""
+    The maximum number of entries in each object-level cache (e.g. a
+    |Subsystem|'s repertoire caches). When a cache grows past this size the
+    least recently used entry is evicted, bounding memory growth during
+    long-running computations.""",
+    )
+
     CLEAR_SUBSYSTEM_CACHES_AFTER_COMPUTING_SIA = Option(
         False,
         type=bool,
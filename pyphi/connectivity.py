@@ -5,11 +5,26 @@ import numpy as np
 from scipy.sparse.csgraph import connected_components
 
 
+def _contiguous_slice(indices):
+    """Return a slice covering ``indices`` if they are a contiguous ascending
+    range, otherwise ``None``."""
+    indices = np.asarray(indices)
+    if indices.size and np.array_equal(
+        indices, np.arange(indices[0], indices[-1] + 1)
+    ):
+        return slice(int(indices[0]), int(indices[-1]) + 1)
+    return None
+
+
 def subadjacency(cm, source, target=None):
     """Return the sub-adjacency matrix for two groups of nodes.
 
     This gives the connections from the first group to the second group.
 
+    Note that when both groups are contiguous ranges of indices, the returned
+    array is a (read-only for practical purposes) view onto ``cm``, not a
+    copy; callers that mutate the result should copy it first.
+
     Arguments:
         source (Iterable[int]): The source nodes.
 
@@ -28,33 +43,39 @@ def subadjacency(cm, source, target=None):
     """
     if target is None:
         target = source
+    # Contiguous ranges (e.g. the node indices of most subsystems) can be
+    # served by basic slicing, which returns a zero-copy view; fall back to
+    # advanced indexing (which copies) otherwise.
+    rows = _contiguous_slice(source)
+    cols = rows if target is source else _contiguous_slice(target)
+    if rows is not None and cols is not None:
+        return cm[rows, cols]
     return cm[np.ix_(source, target)]
 
 
 def apply_boundary_conditions_to_cm(external_indices, cm):
     """Remove connections to or from external nodes."""
-    cm = cm.copy()
-    cm[external_indices, :] = 0  # Zero-out row
-    cm[:, external_indices] = 0  # Zero-out columnt
+    mask = np.ones(cm.shape[0], dtype=cm.dtype)
+    mask[list(external_indices)] = 0
+    cm = cm * mask[:, None]  # Zero-out rows
+    cm *= mask  # Zero-out columns
     return cm
 
 
 def get_inputs_from_cm(index, cm):
     """Return indices of inputs to the node with the given index."""
-    return tuple(i for i in range(cm.shape[0]) if cm[i][index])
+    return tuple(np.flatnonzero(cm[:, index]).tolist())
 
 
 def get_outputs_from_cm(index, cm):
     """Return indices of the outputs of node with the given index."""
-    return tuple(i for i in range(cm.shape[0]) if cm[index][i])
+    return tuple(np.flatnonzero(cm[index]).tolist())
 
 
 def causally_significant_nodes(cm):
     """Return indices of nodes that have both inputs and outputs."""
-    inputs = cm.sum(0)
-    outputs = cm.sum(1)
-    nodes_with_inputs_and_outputs = np.logical_and(inputs > 0, outputs > 0)
-    return tuple(np.where(nodes_with_inputs_and_outputs)[0])
+    has_inputs_and_outputs = cm.any(axis=0) & cm.any(axis=1)
+    return tuple(np.flatnonzero(has_inputs_and_outputs).tolist())
 
 
 # TODO: better name?
@@ -70,15 +91,14 @@ def relevant_connections(n, _from, to):
         np.ndarray: An |n x n| connectivity matrix with the |i,jth| entry is
         ``1`` if |i| is in ``_from`` and |j| is in ``to``, and 0 otherwise.
     """
-    cm = np.zeros((n, n))
-
-    # Don't try and index with empty arrays. Older versions of NumPy
-    # (at least up to 1.9.3) break with empty array indices.
-    if not _from or not to:
-        return cm
-
-    cm[np.ix_(_from, to)] = 1
-    return cm
+    # Build the matrix as the outer product of the source and target masks;
+    # this also handles empty node sets without special-casing (an empty mask
+    # zeroes the product).
+    from_mask = np.zeros(n)
+    from_mask[list(_from)] = 1
+    to_mask = np.zeros(n)
+    to_mask[list(to)] = 1
+    return np.multiply.outer(from_mask, to_mask)
 
 
 def block_cm(cm):
@@ -116,39 +136,20 @@ def block_cm(cm):
         return True
     if np.all(cm.sum(1) == 1):
         return True
+    # A single source node trivially forms a block with its sinks.
+    if cm.shape[0] == 1:
+        return True
 
-    outputs = list(range(cm.shape[1]))
-
-    # CM helpers:
-    def outputs_of(nodes):
-        """Return all nodes that `nodes` connect to (output to)."""
-        return np.where(cm[nodes, :].sum(0))[0]
-
-    def inputs_to(nodes):
-        """Return all nodes which connect to (input to) `nodes`."""
-        return np.where(cm[:, nodes].sum(1))[0]
-
-    # Start: source node with most outputs
-    sources = [np.argmax(cm.sum(1))]
-    sinks = outputs_of(sources)
-    sink_inputs = inputs_to(sinks)
-
-    while True:
-        if np.array_equal(sink_inputs, sources):
-            # sources exclusively connect to sinks.
-            # There are no other nodes which connect sink nodes,
-            # hence set(sources) + set(sinks) form a component
-            # which is not connected to the rest of the graph
-            return True
-
-        # Recompute sources, sinks, and sink_inputs
-        sources = sink_inputs
-        sinks = outputs_of(sources)
-        sink_inputs = inputs_to(sinks)
-
-        # Considering all output nodes?
-        if np.array_equal(sinks, outputs):
-            return False
+    # The rows and columns can be rearranged into blocks exactly when the
+    # bipartite graph on (sources, sinks), with the CM entries as edges, is
+    # disconnected. Count components with scipy's C-level union-find instead
+    # of growing a block in a Python loop.
+    n, m = cm.shape
+    incidence = np.zeros((n + m, n + m))
+    incidence[:n, n:] = cm
+    incidence[n:, :n] = cm.T
+    num_components, _ = connected_components(incidence, directed=False)
+    return num_components > 1
 
 
 # TODO: simplify the conditional validation here and in block_cm
@@ -184,6 +185,33 @@ def _connected(cm, nodes, connection):
     return num_components < 2
 
 
+def _strongly_connected_bitset(cm):
+    """Decide strong connectivity by a Warshall closure over bitset rows.
+
+    Each row of the CM is packed into a single integer of reachability bits,
+    so the transitive closure is ~n² machine-word OR operations — much
+    cheaper than building a sparse graph for the small matrices PyPhi
+    typically evaluates.
+    """
+    n = cm.shape[0]
+    rows = []
+    for i in range(n):
+        mask = 1 << i
+        for j in np.flatnonzero(cm[i]).tolist():
+            mask |= 1 << j
+        rows.append(mask)
+    # Floyd-Warshall closure: after iterating over intermediate node k,
+    # rows[i] holds all nodes reachable from i via intermediates <= k.
+    for k in range(n):
+        row_k = rows[k]
+        bit = 1 << k
+        for i in range(n):
+            if rows[i] & bit:
+                rows[i] |= row_k
+    full = (1 << n) - 1
+    return all(row == full for row in rows)
+
+
 def is_strong(cm, nodes=None):
     """Return whether the connectivity matrix is strongly connected.
 
@@ -195,7 +223,13 @@ def is_strong(cm, nodes=None):
     Keyword Args:
         nodes (tuple[int]): A subset of nodes to consider.
     """
-    return _connected(cm, nodes, "strong")
+    if nodes is not None:
+        cm = subadjacency(cm, nodes)
+    # The bitset closure wins below ~64 nodes, where each row of
+    # reachability bits fits in one machine word.
+    if cm.shape[0] <= 64:
+        return _strongly_connected_bitset(cm)
+    return _connected(cm, None, "strong")
 
 
 def is_weak(cm, nodes=None):
@@ -231,5 +265,6 @@ def is_full(cm, nodes1, nodes2):
 
     cm = subadjacency(cm, nodes1, nodes2)
 
-    # Do all nodes have at least one connection?
-    return cm.sum(0).all() and cm.sum(1).all()
+    # Do all nodes have at least one connection? ``any`` reductions
+    # short-circuit on the first nonzero entry, unlike summing the axis.
+    return bool(cm.any(axis=0).all() and cm.any(axis=1).all())
@@ -1,6 +1,8 @@
 # distribution.py
 """Functions for manipulating probability distributions."""
 
+from functools import lru_cache
+
 import numpy as np
 
 from .cache import cache
@@ -99,6 +101,12 @@ def purview_size(repertoire):
     return len(purview(repertoire))
 
 
+@lru_cache(maxsize=4096)
+def _repertoire_shape(all_node_indices, purview):  # pylint: disable=redefined-outer-name
+    # TODO: extend to non-binary nodes
+    return tuple(2 if i in purview else 1 for i in all_node_indices)
+
+
 def repertoire_shape(all_node_indices, purview):  # pylint: disable=redefined-outer-name
     """Return the shape a repertoire.
 
@@ -115,8 +123,9 @@ def repertoire_shape(all_node_indices, purview):  # pylint: disable=redefined-ou
         >>> repertoire_shape(range(3), purview)
         [2, 1, 2]
     """
-    # TODO: extend to non-binary nodes
-    return [2 if i in purview else 1 for i in all_node_indices]
+    # Memoized as a tuple (this is called for every repertoire computation);
+    # a fresh list is returned so callers remain free to mutate it.
+    return list(_repertoire_shape(tuple(all_node_indices), tuple(purview)))
 
 
 def flatten(repertoire, big_endian=False):
@@ -1,6 +1,8 @@
 # graphs.py
 """Graph-theoretic algorithms."""
 
+from functools import lru_cache
+
 from .exceptions import MissingOptionalDependenciesError
 
 try:
@@ -11,6 +13,20 @@ except ModuleNotFoundError as exc:
     ) from exc
 
 
+@lru_cache(maxsize=64)
+def _to_igraph(nodes, edges):
+    """Build an igraph graph from immutable node and edge tuples.
+
+    Cached so that repeated queries on the same graph (typical during a
+    single SIA computation) skip the conversion. Node attributes are not
+    copied; callers map vertex IDs back to nodes by position in ``nodes``.
+    """
+    index = {node: i for i, node in enumerate(nodes)}
+    return ig.Graph(
+        n=len(nodes), edges=[(index[u], index[v]) for (u, v) in edges]
+    )
+
+
 def maximal_independent_sets(nx_graph):
     """Yield the maximal independent sets of a NetworkX graph.
 
@@ -19,10 +35,11 @@ def maximal_independent_sets(nx_graph):
     Time complexity is exponential in the worst case.
     """
     # Convert to igraph for faster maximal independent set implementation
-    G = ig.Graph.from_networkx(nx_graph)
+    nodes = tuple(nx_graph.nodes)
+    G = _to_igraph(nodes, tuple(nx_graph.edges))
     for vertices in G.maximal_independent_vertex_sets():
         # Convert node IDs to mechanisms
-        yield G.vs[vertices]["_nx_name"]
+        yield [nodes[v] for v in vertices]
 
 
 def largest_independent_sets(nx_graph):
@@ -33,7 +50,8 @@ def largest_independent_sets(nx_graph):
     Time complexity is exponential in the worst case.
     """
     # Convert to igraph for faster maximal independent set implementation
-    G = ig.Graph.from_networkx(nx_graph)
+    nodes = tuple(nx_graph.nodes)
+    G = _to_igraph(nodes, tuple(nx_graph.edges))
     for vertices in G.largest_independent_vertex_sets():
         # Convert node IDs to mechanisms
-        yield G.vs[vertices]["_nx_name"]
+        yield [nodes[v] for v in vertices]
@@ -142,6 +142,8 @@ def jsonify(obj):  # pylint: disable=too-many-return-statements
         return int(obj)
     if isinstance(obj, np.float64):
         return float(obj)
+    if isinstance(obj, np.dtype):
+        return str(obj)
 
     # Recurse over dictionaries.
     if isinstance(obj, dict):
@@ -214,6 +216,8 @@ def _is_loadable_model_object(obj):
 class _ObjectCache(cache.DictCache):
     """Cache mapping ids to loaded objects, keyed by the id of the object."""
 
+    __slots__ = ()
+
     def key(self, dct, **kwargs):  # pylint: disable=arguments-differ
         return _get_metadata(dct)
 
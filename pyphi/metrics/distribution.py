@@ -9,7 +9,7 @@ from scipy.spatial.distance import cdist
 from scipy.special import entr, rel_entr
 
 from .. import utils, validate
-from ..cache import joblib_memory
+from ..cache import two_tier_memory
 from ..conf import config, fallback
 from ..direction import Direction
 from ..distribution import flatten, marginal_zero
@@ -187,7 +187,7 @@ def _hamming_matrix(N):
     return _compute_hamming_matrix(N)
 
 
-@joblib_memory.cache
+@two_tier_memory()
 def _compute_hamming_matrix(N):
     """Compute and store a Hamming matrix for |N| nodes.
 
@@ -224,6 +224,12 @@ def hamming_emd(p, q):
     """
     N = p.squeeze().ndim
     p, q = flatten(p), flatten(q)
+    if N == 1:
+        # For a single binary node the Hamming distance between states is just
+        # the linear distance, so the EMD is the L1 distance between the
+        # cumulative distributions; there is no transportation problem to
+        # solve.
+        return float(np.abs(np.cumsum(p) - np.cumsum(q)).sum())
     return EMD.compute(p, q, _hamming_matrix(N))
 
 
@@ -68,6 +68,7 @@ class Network:
             raise TypeError(f"Invalid tpm of type {type(tpm)}.")
 
         self._cm, self._cm_hash = self._build_cm(cm)
+        self._causally_significant_nodes = None
         self._node_indices = tuple(range(self.size))
         self._node_labels = NodeLabels(node_labels, self._node_indices)
         self.purview_cache = purview_cache or cache.PurviewCache()
@@ -97,9 +98,14 @@ class Network:
         """
         if cm is None:
             # Assume all are connected.
-            cm = np.ones((self.size, self.size))
+            cm = np.ones((self.size, self.size), dtype=np.uint8)
         else:
             cm = np.array(cm)
+            # CMs are binary; a byte per entry keeps the footprint (and the
+            # bandwidth of the any/all reductions over it) minimal. Leave
+            # non-binary input untouched so that validation can reject it.
+            if np.all(np.logical_or(cm == 1, cm == 0)):
+                cm = np.ascontiguousarray(cm, dtype=np.uint8)
 
         utils.np_immutable(cm)
 
@@ -112,8 +118,16 @@ class Network:
 
     @property
     def causally_significant_nodes(self):
-        """See :func:`pyphi.connectivity.causally_significant_nodes`."""
-        return connectivity.causally_significant_nodes(self.cm)
+        """See :func:`pyphi.connectivity.causally_significant_nodes`.
+
+        Computed once per network, since the CM is immutable; complex
+        enumeration queries this on every lattice walk.
+        """
+        if self._causally_significant_nodes is None:
+            self._causally_significant_nodes = (
+                connectivity.causally_significant_nodes(self.cm)
+            )
+        return self._causally_significant_nodes
 
     @property
     def size(self):
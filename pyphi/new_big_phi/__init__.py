@@ -332,7 +332,8 @@ def sia(
     #   bipartitions are over their micro elements.
     if len(subsystem.cut_indices) == 1:
         # If the node lacks a self-loop, phi is trivially zero.
-        if not subsystem.cm[subsystem.node_indices][subsystem.node_indices]:
+        node = subsystem.node_indices[0]
+        if not subsystem.cm[node, node]:
             return _null_sia()
         # Even if the node has a self-loop, we may still define phi to be zero.
         elif not config.SINGLE_MICRO_NODES_WITH_SELFLOOPS_HAVE_PHI:
@@ -11,6 +11,19 @@ from .labels import NodeLabels
 from .tpm import ExplicitTPM
 
 
+def _stack_on_off(tpm_on):
+    """Stack ON probabilities with their complement along a new last axis.
+
+    Equivalent to ``np.stack([1 - tpm_on, tpm_on], axis=-1)``, but writes
+    into a single preallocated buffer instead of materializing the
+    complement and then copying both arrays.
+    """
+    out = np.empty(tpm_on.shape + (2,), dtype=tpm_on.dtype)
+    np.subtract(1, tpm_on, out=out[..., 0])
+    out[..., 1] = tpm_on
+    return out
+
+
 # TODO extend to nonbinary nodes
 @functools.total_ordering
 class Node:
@@ -38,7 +51,17 @@ class Node:
             probabilities that the node will be 'ON'.
     """
 
-    def __init__(self, cause_tpm, effect_tpm, cm, index, state, node_labels):
+    def __init__(
+        self,
+        cause_tpm,
+        effect_tpm,
+        cm,
+        index,
+        state,
+        node_labels,
+        cause_tpm_indices=None,
+        effect_tpm_indices=None,
+    ):
         # This node's index in the list of nodes.
         self.index = index
 
@@ -68,27 +91,26 @@ class Node:
         # the subsystem's TPM.
 
         # TODO use names rather than indices
-        cause_non_inputs = set(cause_tpm.tpm_indices()) - self._inputs
+        # The TPM index sets are subsystem-wide invariants, so they can be
+        # computed once in `generate_nodes` and shared by every node.
+        if cause_tpm_indices is None:
+            cause_tpm_indices = frozenset(cause_tpm.tpm_indices())
+        if effect_tpm_indices is None:
+            effect_tpm_indices = frozenset(effect_tpm.tpm_indices())
+
+        cause_non_inputs = cause_tpm_indices - self._inputs
         cause_tpm_on = cause_tpm_on.marginalize_out(cause_non_inputs).tpm
 
-        effect_non_inputs = set(effect_tpm.tpm_indices()) - self._inputs
+        effect_non_inputs = effect_tpm_indices - self._inputs
         effect_tpm_on = effect_tpm_on.marginalize_out(effect_non_inputs).tpm
 
-        # Get the TPM that gives the probability of the node being off, rather
-        # than on.
-        cause_tpm_off = 1 - cause_tpm_on
-        effect_tpm_off = 1 - effect_tpm_on
-
-        # Combine the on- and off-TPM so that the first dimension is indexed by
-        # the state of the node's inputs at t, and the last dimension is
-        # indexed by the node's state at t+1. This representation makes it easy
-        # to condition on the node state.
-        self.cause_tpm = ExplicitTPM(
-            np.stack([cause_tpm_off, cause_tpm_on], axis=-1),
-        )
-        self.effect_tpm = ExplicitTPM(
-            np.stack([effect_tpm_off, effect_tpm_on], axis=-1),
-        )
+        # Combine each on-TPM with its complement (the probability of the node
+        # being off) so that the first dimension is indexed by the state of
+        # the node's inputs at t, and the last dimension is indexed by the
+        # node's state at t+1. This representation makes it easy to condition
+        # on the node state.
+        self.cause_tpm = ExplicitTPM(_stack_on_off(cause_tpm_on))
+        self.effect_tpm = ExplicitTPM(_stack_on_off(effect_tpm_on))
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
         # Only compute the hash once.
@@ -199,8 +221,21 @@ def generate_nodes(cause_tpm, effect_tpm, cm, network_state, indices, node_label
 
     node_state = utils.state_of(indices, network_state)
 
+    # Computed once here rather than per-node.
+    cause_tpm_indices = frozenset(cause_tpm.tpm_indices())
+    effect_tpm_indices = frozenset(effect_tpm.tpm_indices())
+
     return tuple(
-        Node(cause_tpm, effect_tpm, cm, index, state, node_labels)
+        Node(
+            cause_tpm,
+            effect_tpm,
+            cm,
+            index,
+            state,
+            node_labels,
+            cause_tpm_indices=cause_tpm_indices,
+            effect_tpm_indices=effect_tpm_indices,
+        )
         for index, state in zip(indices, node_state)
     )
 
@@ -1,6 +1,7 @@
 # repertoire.py
 """Compute cause-effect repertoires."""
 
+import functools
 from typing import Callable, Tuple
 
 import numpy as np
@@ -62,12 +63,39 @@ def forward_cause_repertoire(
     subsystem, mechanism: Tuple[int], purview: Tuple[int], purview_state=None
 ) -> ArrayLike:
     mechanism_state = utils.state_of(mechanism, subsystem.state)
+    node_indices = subsystem.network.node_indices
+    if purview and purview_state is None:
+        # Compute the probabilities for all purview states in one batch:
+        # rather than conditioning each mechanism node's TPM on one purview
+        # state at a time (2^n Python-level calls), leave the purview
+        # dimensions unconditioned so the joint product is indexed by purview
+        # state directly.
+        purview_set = frozenset(purview)
+        per_node = [
+            node.cause_tpm.marginalize_out(node.inputs - purview_set).tpm[..., state]
+            for node, state in zip(
+                subsystem.indices2nodes(mechanism), mechanism_state
+            )
+        ]
+        if per_node:
+            joint = functools.reduce(np.multiply, per_node)
+        else:
+            joint = np.ones([1] * len(node_indices))
+        # Broadcast singleton purview dimensions (purview nodes that input no
+        # mechanism node) and arrange the dimensions in purview order.
+        shape = list(joint.shape)
+        for q in purview:
+            shape[q] = 2
+        other_axes = tuple(i for i in range(joint.ndim) if i not in purview_set)
+        repertoire = (
+            np.broadcast_to(joint, shape)
+            .transpose(tuple(purview) + other_axes)
+            .reshape([2] * len(purview))
+        )
+        return repertoire.reshape(repertoire_shape(node_indices, purview))
     if purview:
         repertoire = np.empty([2] * len(purview))
-        if purview_state is None:
-            purview_states = utils.all_states(len(purview))
-        else:
-            purview_states = [purview_state]
+        purview_states = [purview_state]
     else:
         repertoire = np.array([1])
         purview_states = [()]
@@ -79,24 +107,51 @@ def forward_cause_repertoire(
             purview_state,
             mechanism_state=mechanism_state,
         )
-    return repertoire.reshape(repertoire_shape(subsystem.network.node_indices, purview))
+    return repertoire.reshape(repertoire_shape(node_indices, purview))
 
 
 def unconstrained_forward_effect_repertoire(
     subsystem, mechanism: Tuple[int], purview: Tuple[int]
 ) -> ArrayLike:
-    # Get the effect repertoire for each mechanism state.
-    repertoires = np.stack(
-        [
-            subsystem.forward_effect_repertoire(
-                mechanism, purview, mechanism_state=state
+    # The average over all mechanism states of the effect repertoire is
+    # computed in a single batch: instead of conditioning each purview node's
+    # TPM on one mechanism state at a time (2^n Python-level repertoire
+    # calls), the mechanism dimensions are left unconditioned, so the joint
+    # product is indexed by mechanism state in its leading axes. Averaging
+    # over those axes then marginalizes over all mechanism states at once.
+    # TODO(nonbinary) extend to nonbinary nodes
+    if not purview:
+        return np.array([1.0])
+    node_indices = subsystem.network.node_indices
+    mechanism_set = frozenset(mechanism)
+    per_node = []
+    for node in subsystem.indices2nodes(purview):
+        # Marginalize out inputs that are not in the mechanism, keeping the
+        # mechanism dimensions; the last axis is the node's next state, which
+        # is moved into the trailing (repertoire) axes.
+        tpm = node.effect_tpm.marginalize_out(node.inputs - mechanism_set).tpm
+        per_node.append(
+            tpm.reshape(
+                tpm.shape[:-1]
+                + tuple(repertoire_shape(node_indices, (node.index,)))
             )
-            # TODO(nonbinary) extend to nonbinary nodes
-            for state in utils.all_states(len(mechanism))
-        ]
+        )
+    joint = functools.reduce(np.multiply, per_node)
+    # Broadcast every mechanism dimension to full size and move them to the
+    # front, ordered so that C-order enumeration matches utils.all_states
+    # (first mechanism node varying fastest). The average over mechanism
+    # states is then bit-for-bit identical to stacking the per-state
+    # repertoires and averaging over the first axis.
+    shape = list(joint.shape)
+    for m in mechanism:
+        shape[m] = 2
+    mechanism_axes = tuple(reversed(mechanism))
+    other_axes = tuple(i for i in range(joint.ndim) if i not in mechanism_set)
+    joint = np.broadcast_to(joint, shape).transpose(mechanism_axes + other_axes)
+    n_repertoire_dims = len(repertoire_shape(node_indices, purview))
+    return joint.reshape((-1,) + joint.shape[joint.ndim - n_repertoire_dims :]).mean(
+        axis=0
     )
-    # Marginalize over all mechanism states.
-    return repertoires.mean(axis=0)
 
 
 def unconstrained_forward_cause_repertoire(
@@ -112,6 +167,7 @@ def unconstrained_forward_cause_repertoire(
     mean_forward_cause_probability = subsystem.forward_cause_repertoire(
         mechanism, purview, None
     ).mean()
-    repertoire = np.empty(repertoire_shape(subsystem.network.node_indices, purview))
-    repertoire.fill(mean_forward_cause_probability)
-    return repertoire
+    return np.full(
+        repertoire_shape(subsystem.network.node_indices, purview),
+        mean_forward_cause_probability,
+    )
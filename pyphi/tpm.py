@@ -2,7 +2,6 @@
 """Provides classes for representing TPMs."""
 
 import math
-from itertools import chain
 from typing import Mapping, Set, Iterable
 
 import numpy as np
@@ -214,17 +213,25 @@ class ExplicitTPM(data_structures.ArrayLike):
         }
     )
 
-    def __getattr__(self, name):
-        if name in self.__closures__:
-            return _new_attribute(name, self.__closures__, self._tpm)
-        else:
-            return getattr(self.__getattribute__(self._VALUE_ATTR), name)
+    # Note: the methods named in ``__closures__`` are installed on the class
+    # at import time (see ``_make_closed_method`` below); other attribute
+    # access falls through to the underlying array via
+    # ``ArrayLike.__getattr__``.
 
     def __len__(self):
         return len(self.__getattribute__(self._VALUE_ATTR))
 
     def __init__(self, tpm, validate=False):
-        self._tpm = np.array(tpm)
+        # Zero-copy fast path: arrays produced by intermediate operations
+        # (conditioning, marginalizing, arithmetic, ...) are freshly
+        # allocated, so copying them again is pure waste. Arrays that don't
+        # own their data (views) are copied, so that freezing below cannot be
+        # circumvented through another reference to the same buffer.
+        tpm = np.asarray(tpm)
+        if not tpm.flags.owndata:
+            tpm = tpm.copy()
+        self._tpm = tpm
+        self._multidim = None
         super().__init__()
 
         if validate:
@@ -232,7 +239,15 @@ class ExplicitTPM(data_structures.ArrayLike):
             self._tpm = self.to_multidimensional_state_by_node()
 
         self._tpm = np_immutable(self._tpm)
-        self._hash = np_hash(self._tpm)
+        self._hash = None
+        self._tpm_indices = None
+        # Cache hot scalar attributes on the instance; every access would
+        # otherwise take __getattr__'s double attribute lookup. Safe since
+        # the array is frozen.
+        self.shape = self._tpm.shape
+        self.ndim = self._tpm.ndim
+        self.size = self._tpm.size
+        self.dtype = self._tpm.dtype
 
     @property
     def tpm(self):
@@ -247,7 +262,9 @@ class ExplicitTPM(data_structures.ArrayLike):
 
     def _validate_probabilities(self):
         """Check that the probabilities in a TPM are valid."""
-        if (self._tpm < 0.0).any() or (self._tpm > 1.0).any():
+        # Min/max reductions allocate nothing, unlike elementwise comparisons,
+        # which would materialize two full-size boolean arrays.
+        if self.size and (self._tpm.min() < 0.0 or self._tpm.max() > 1.0):
             raise ValueError(
                 "Invalid TPM: probabilities must be in the interval [0, 1]."
             )
@@ -319,17 +336,20 @@ class ExplicitTPM(data_structures.ArrayLike):
         Returns:
             np.ndarray: The TPM in multidimensional state-by-node format.
         """
-        if self.is_state_by_state():
-            tpm = convert.state_by_state2state_by_node(self._tpm)
-        else:
-            tpm = convert.to_multidimensional(self._tpm)
+        # The TPM array is immutable, so the conversion is computed at most
+        # once; ``infer_edge`` alone would otherwise redo it for every pair
+        # of nodes.
+        if self._multidim is None:
+            if self.is_state_by_state():
+                self._multidim = convert.state_by_state2state_by_node(self._tpm)
+            else:
+                self._multidim = convert.to_multidimensional(self._tpm)
 
-        return tpm
+        return self._multidim
 
     def conditionally_independent(self):
         """Validate that the TPM is conditionally independent."""
         tpm = self._tpm
-        tpm = np.array(tpm)
         if self.is_state_by_state():
             there_and_back_again = convert.state_by_node2state_by_state(
                 convert.state_by_state2state_by_node(tpm)
@@ -338,7 +358,7 @@ class ExplicitTPM(data_structures.ArrayLike):
             there_and_back_again = convert.state_by_state2state_by_node(
                 convert.state_by_node2state_by_state(tpm)
             )
-        if not np.allclose((tpm - there_and_back_again), 0.0):
+        if not np.allclose(tpm, there_and_back_again):
             raise exceptions.ConditionallyDependentError(
                 "TPM is not conditionally independent.\n"
                 "See the conditional independence example in the documentation "
@@ -364,17 +384,19 @@ class ExplicitTPM(data_structures.ArrayLike):
             singleton dimensions for nodes in a fixed state.
         """
         # Assumes multidimensional form
-        conditioning_indices = [[slice(None)]] * (self.ndim - 1)
+        conditioning_indices = [slice(None)] * (self.ndim - 1)
+        conditioned_axes = []
         for i, state_i in condition.items():
             # Ignore dimensions that are already singletons
             if self.shape[i] != 1:
-                # Preserve singleton dimensions in output array with `np.newaxis`
-                conditioning_indices[i] = [state_i, np.newaxis]
-        # Flatten the indices.
-        conditioning_indices = tuple(chain.from_iterable(conditioning_indices))
+                conditioning_indices[i] = state_i
+                conditioned_axes.append(i)
         # Obtain the actual conditioned TPM by indexing with the conditioning
-        # indices.
-        tpm = self._tpm[conditioning_indices]
+        # indices (pure basic indexing, so this is just a view), then restore
+        # the dropped dimensions as singletons suitable for broadcasting.
+        tpm = np.expand_dims(
+            self._tpm[tuple(conditioning_indices)], tuple(sorted(conditioned_axes))
+        )
         # Create new TPM object of the same type as self.
         # self.tpm has already been validated and converted to multidimensional
         # state-by-node form. Further validation would be problematic for
@@ -391,9 +413,14 @@ class ExplicitTPM(data_structures.ArrayLike):
             ExplicitTPM: A TPM with the same number of dimensions, with the nodes
             marginalized out.
         """
-        tpm = self._tpm.sum(tuple(node_indices), keepdims=True) / (
-            np.array(self.shape)[list(node_indices)].prod()
-        )
+        node_indices = tuple(node_indices)
+        divisor = 1
+        for i in node_indices:
+            divisor *= self.shape[i]
+        # Each axis has length 1 or 2, so the divisor is a power of two and
+        # multiplying by its reciprocal is bitwise-identical to dividing,
+        # while being cheaper per element.
+        tpm = self._tpm.sum(node_indices, keepdims=True) * (1.0 / divisor)
         # Return new TPM object of the same type as self.
         # self._tpm has already been validated and converted to multidimensional
         # state-by-node form. Further validation would be problematic for
@@ -402,7 +429,11 @@ class ExplicitTPM(data_structures.ArrayLike):
 
     def is_deterministic(self):
         """Return whether the TPM is deterministic."""
-        return np.all(np.logical_or(self._tpm == 1, self._tpm == 0))
+        # p is 0 or 1 exactly when p * (p - 1) == 0, so one arithmetic
+        # temporary replaces the two boolean arrays and logical-or pass.
+        scratch = self._tpm - 1.0
+        scratch *= self._tpm
+        return not scratch.any()
 
     def is_state_by_state(self):
         """Return ``True`` if ``tpm`` is in state-by-state form, otherwise
@@ -440,8 +471,11 @@ class ExplicitTPM(data_structures.ArrayLike):
         """Broadcast a state-by-node TPM so that singleton dimensions are expanded
         over the full network.
         """
-        unconstrained = np.ones([2] * (self._tpm.ndim - 1) + [self._tpm.shape[-1]])
-        return type(self)(self._tpm * unconstrained)
+        # Broadcasting produces a read-only view; the constructor's np.array
+        # call materializes it, so no separate allocate-and-multiply pass is
+        # needed.
+        target = (2,) * (self._tpm.ndim - 1) + (self._tpm.shape[-1],)
+        return type(self)(np.broadcast_to(self._tpm, target))
 
     def infer_edge(self, a, b, contexts):
         """Infer the presence or absence of an edge from node A to node B.
@@ -481,16 +515,29 @@ class ExplicitTPM(data_structures.ArrayLike):
         """
         tpm = self.to_multidimensional_state_by_node()
         network_size = tpm.shape[-1]
-        all_contexts = tuple(all_states(network_size - 1))
         cm = np.empty((network_size, network_size), dtype=int)
-        for a, b in np.ndindex(cm.shape):
-            cm[a][b] = self.infer_edge(a, b, all_contexts)
+        index = [slice(None)] * tpm.ndim
+        for a in range(network_size):
+            # There is an edge from A to B iff toggling A changes the
+            # probability of B in some context (cf. `infer_edge`); comparing
+            # the two slices along A's axis yields the whole CM row at once.
+            # Basic indexing gives views, so no half-tensor copies are made.
+            index[a] = 0
+            off = tpm[tuple(index)]
+            index[a] = 1
+            on = tpm[tuple(index)]
+            index[a] = slice(None)
+            cm[a] = (on != off).any(axis=tuple(range(network_size - 1)))
         return cm
 
     def tpm_indices(self):
         """Return the indices of nodes in the TPM."""
         # TODO This currently assumes binary elements (2)
-        return tuple(np.where(np.array(self.shape[:-1]) == 2)[0])
+        # The TPM array is immutable, so this is computed at most once; each
+        # node in a subsystem queries the same subsystem-wide TPM.
+        if self._tpm_indices is None:
+            self._tpm_indices = tuple(np.where(np.array(self.shape[:-1]) == 2)[0])
+        return self._tpm_indices
 
     def print(self):
         tpm = convert.to_multidimensional(self._tpm)
@@ -530,9 +577,62 @@ class ExplicitTPM(data_structures.ArrayLike):
         return "ExplicitTPM({})".format(self._tpm)
 
     def __hash__(self):
+        # Computed on first use: hashing is a full pass over the array, and
+        # most intermediate TPMs (from conditioning, marginalizing, etc.) are
+        # never hashed. Safe to cache since the array is immutable.
+        if self._hash is None:
+            self._hash = np_hash(self._tpm)
         return self._hash
 
 
+# TODO(tpm) remove pending ArrayLike refactor
+def _make_closed_method(name: str, cls=ExplicitTPM) -> object:
+    """Build a concrete method proxying ``name`` to the underlying array.
+
+    Results are cast back to ``cls`` with the same semantics as
+    :func:`_new_attribute`, but the method is generated once at
+    class-creation time, so calling it is an ordinary bound-method call
+    rather than a ``__getattr__`` miss that allocates a fresh closure on
+    every attribute access.
+    """
+    array_method = getattr(cls.__wraps__, name)
+
+    def closed_method(self, *args, **kwargs):
+        # If second operand is a custom TPM object, access its array.
+        if args and isinstance(args[0], cls):
+            args = (args[0]._tpm,) + args[1:]
+
+        result = array_method(self._tpm, *args, **kwargs)
+
+        # Array.
+        if isinstance(result, cls.__wraps__):
+            return cls(result)
+
+        # Multivalued "functions" returning a tuple (__divmod__()).
+        if isinstance(result, tuple):
+            return (cls(r) for r in result)
+
+        # Scalars (e.g. sum(), max()), etc.
+        return result
+
+    closed_method.__name__ = name
+    closed_method.__qualname__ = f"{cls.__name__}.{name}"
+    # Don't copy numpy's docstring: its doctest examples would be collected
+    # by --doctest-modules and fail against the proxy.
+    closed_method.__doc__ = (
+        f"Proxy for :meth:`numpy.ndarray.{name}`; "
+        f"array results are cast to {cls.__name__}."
+    )
+    return closed_method
+
+
+for _name in ExplicitTPM.__closures__:
+    # Guard against array methods deprecated between numpy versions.
+    if hasattr(ExplicitTPM.__wraps__, _name):
+        setattr(ExplicitTPM, _name, _make_closed_method(_name))
+del _name
+
+
 def reconstitute_tpm(subsystem):
     """Reconstitute the TPM of a subsystem using the individual node TPMs."""
     # The last axis of the node TPMs correponds to ON or OFF probabilities
@@ -541,18 +641,13 @@ def reconstitute_tpm(subsystem):
     node_tpms = [node.effect_tpm.tpm[..., 1] for node in subsystem.nodes]
     # Remove the singleton dimensions corresponding to external nodes
     node_tpms = [tpm.squeeze(axis=subsystem.external_indices) for tpm in node_tpms]
-    # We add a new singleton axis at the end so that we can use
-    # pyphi.tpm.expand_tpm, which expects a state-by-node TPM (where the last
-    # axis corresponds to nodes.)
-    node_tpms = [np.expand_dims(tpm, -1) for tpm in node_tpms]
-    # Now we expand the node TPMs to the full state space, so we can combine
-    # them all (this uses the maximum entropy distribution).
-    node_tpms = [
-        tpm * np.ones([2] * (tpm.ndim - 1) + [tpm.shape[-1]]) for tpm in node_tpms
-    ]
-    # We concatenate the node TPMs along a new axis to get a multidimensional
-    # state-by-node TPM (where the last axis corresponds to nodes).
-    return np.concatenate(node_tpms, axis=-1)
+    # Now we expand the node TPMs to the full state space (this uses the
+    # maximum entropy distribution) and stack them along a new last axis to
+    # get a multidimensional state-by-node TPM (where the last axis
+    # corresponds to nodes). Broadcasting gives zero-copy views; np.stack
+    # does the single copy.
+    shape = (2,) * node_tpms[0].ndim
+    return np.stack([np.broadcast_to(tpm, shape) for tpm in node_tpms], axis=-1)
 
 
 # TODO(tpm) remove pending ArrayLike refactor
@@ -608,25 +703,47 @@ def _new_attribute(
     return overriding_attribute
 
 
-def probability_of_current_state(sbn_tpm, current_state):
+def probability_of_current_state(sbn_tpm, current_state, out=None):
     """Return the probability of the current state as a distribution over previous states.
 
     Arguments:
         sbn_tpm (ExplicitTPM): State-by-node TPM.
         current_state (tuple[int]): The current state.
+
+    Keyword Args:
+        out (np.ndarray): Buffer of shape ``sbn_tpm.shape[:-1] + (1,)`` to
+            write the result into, allowing repeated callers to reuse one
+            workspace instead of allocating a new array per call.
     """
-    state_probabilities = np.empty(sbn_tpm.shape)
-    if not len(current_state) == sbn_tpm.shape[-1]:
+    N = sbn_tpm.shape[-1]
+    if not len(current_state) == N:
         raise ValueError(
-            f"current_state must have length {sbn_tpm.shape[-1]}"
+            f"current_state must have length {N}"
             f"for state-by-node TPM of shape {sbn_tpm.shape}"
         )
-    for i in range(sbn_tpm.shape[-1]):
-        # TODO extend to nonbinary nodes
-        state_probabilities[..., i] = (
-            sbn_tpm[..., i] if current_state[i] else (1 - sbn_tpm[..., i])
-        )
-    return state_probabilities.prod(axis=-1, keepdims=True)
+    tpm = sbn_tpm.tpm
+    if out is None:
+        out = np.empty(tpm.shape[:-1] + (1,), dtype=tpm.dtype)
+    # Accumulate the product over nodes in a single streaming pass, rather
+    # than materializing all N selected slices and reducing them afterwards.
+    # The (1 - p) factors for OFF nodes go through one reused scratch buffer
+    # instead of allocating a fresh temporary per node.
+    # TODO extend to nonbinary nodes
+    probability = out[..., 0]
+    if current_state[0]:
+        probability[...] = tpm[..., 0]
+    else:
+        np.subtract(1, tpm[..., 0], out=probability)
+    scratch = None
+    for i in range(1, N):
+        if current_state[i]:
+            probability *= tpm[..., i]
+        else:
+            if scratch is None:
+                scratch = np.empty_like(probability)
+            np.subtract(1, tpm[..., i], out=scratch)
+            probability *= scratch
+    return out
 
 
 def backward_tpm(
@@ -657,9 +774,13 @@ def backward_tpm(
     #                                              Σ_{s_{t–1}} p(u_t | s_{t–1}, w_{t–1})
     # Σ_{w_{t–1}}   p(s_{i,t} | s_{t–1}, w_{t–1}) ———————————————————————————————————————
     #                                                 Σ_{u'_{t–1}} p(u_t | u'_{t–1})
-    backward_tpm = (
-        forward_tpm * pr_current_state_given_only_background / normalization
-    ).sum(axis=background_indices, keepdims=True)
+    # Work on the raw array, dividing in place, so that only one full-sized
+    # temporary is materialized before the sum over the background.
+    backward_tpm = np.multiply(
+        forward_tpm.tpm, pr_current_state_given_only_background
+    )
+    np.divide(backward_tpm, normalization, out=backward_tpm)
+    backward_tpm = backward_tpm.sum(axis=background_indices, keepdims=True)
     if remove_background:
         # Remove background units from last dimension of the state-by-node TPM
         backward_tpm = backward_tpm[..., list(system_indices)]
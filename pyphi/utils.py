@@ -5,6 +5,7 @@ import hashlib
 import math
 import operator
 import os
+from functools import lru_cache
 from itertools import chain, combinations, product
 from typing import Tuple
 
@@ -59,21 +60,61 @@ def all_states(n, big_endian=False):
             yield state[::-1]  # Convert to little-endian ordering
 
 
+@lru_cache(maxsize=32)
+def all_states_array(n):
+    """Return all binary states for a system as a single array.
+
+    Row ``i`` is the ``i``-th state yielded by :func:`all_states` (so states
+    are in little-endian order). The result is read-only and cached, so
+    repeated callers share one contiguous array instead of re-allocating
+    |2^n| state tuples.
+
+    Args:
+        n (int): The number of elements in the system.
+
+    Returns:
+        np.ndarray: A ``(2**n, n)`` array of states, one per row.
+    """
+    states = ((np.arange(1 << n)[:, None] >> np.arange(n)) & 1).astype(np.uint8)
+    states.flags.writeable = False
+    return states
+
+
 def np_immutable(a):
     """Make a NumPy array immutable."""
     a.flags.writeable = False
     return a
 
 
+try:
+    import xxhash
+
+    def _array_digest(data):
+        """Digest a buffer with xxh3, a non-cryptographic hash that is an
+        order of magnitude faster than the hashes in ``hashlib``."""
+        return xxhash.xxh3_64_intdigest(data)
+
+except ModuleNotFoundError:
+
+    def _array_digest(data):
+        """Digest a buffer with blake2b (fallback when xxhash is missing)."""
+        return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "big")
+
+
 def np_hash(a):
-    """Return a hash of a NumPy array."""
+    """Return a hash of a NumPy array.
+
+    Hashes are only used for object identity at runtime, so a fast
+    non-cryptographic digest is used; TPM-sized arrays are hashed on every
+    ExplicitTPM construction.
+    """
     if a is None:
         return hash(None)
     # Ensure that hashes are equal whatever the ordering in memory (C or
     # Fortran)
     a = np.ascontiguousarray(a)
     # Compute the digest and return a decimal int
-    return int(hashlib.sha1(a.view(a.dtype)).hexdigest(), 16)
+    return _array_digest(a.view(a.dtype))
 
 
 class np_hashable:
@@ -1,20 +1,55 @@
 # visualize/__init__.py
 """Provides visualization capabilities for PyPhi objects."""
 
+from importlib import import_module
+
 from ..exceptions import MissingOptionalDependenciesError
 
-try:
-    import matplotlib
-    import plotly
-    import seaborn
-except ImportError as exc:
-    raise MissingOptionalDependenciesError(
-        MissingOptionalDependenciesError.MSG.format(dependencies="visualize")
-    ) from exc
-
-from .distribution import plot_distribution, plot_repertoires
-from .dynamics import plot_dynamics
-from .connectivity import plot_graph, plot_subsystem
-from .phi_structure import plot_phi_structure, highlight_phi_fold
-from . import phi_structure
-from . import ising
+# Public names, mapped to the submodule that provides them.
+_EXPORTS = {
+    "plot_distribution": "distribution",
+    "plot_repertoires": "distribution",
+    "plot_dynamics": "dynamics",
+    "plot_graph": "connectivity",
+    "plot_subsystem": "connectivity",
+    "plot_phi_structure": "phi_structure",
+    "highlight_phi_fold": "phi_structure",
+    "phi_structure": "phi_structure",
+    "ising": "ising",
+}
+
+_dependencies_checked = False
+
+
+def _ensure_dependencies():
+    """Check for the optional plotting stack, raising if it is missing."""
+    global _dependencies_checked
+    if _dependencies_checked:
+        return
+    try:
+        import matplotlib  # noqa: F401
+        import plotly  # noqa: F401
+        import seaborn  # noqa: F401
+    except ImportError as exc:
+        raise MissingOptionalDependenciesError(
+            MissingOptionalDependenciesError.MSG.format(dependencies="visualize")
+        ) from exc
+    _dependencies_checked = True
+
+
+def __getattr__(name):
+    # Resolve the public names lazily (PEP 562), so that merely importing
+    # this module does not pay for importing matplotlib, plotly and seaborn
+    # (the slowest cold-start cost in the library).
+    if name in _EXPORTS:
+        _ensure_dependencies()
+        module = import_module("." + _EXPORTS[name], __name__)
+        value = module if name == _EXPORTS[name] else getattr(module, name)
+        # Cache on the module so subsequent accesses skip this hook.
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
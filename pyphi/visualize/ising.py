@@ -7,9 +7,8 @@ import numpy as np
 import pandas as pd
 import seaborn as sb
 
-from ..utils import all_states
 from ..network_generator import utils
-from ..network_generator.ising import energy
+from ..utils import all_states_array
 
 
 def plot_sigmoid(x, temperature=1.0, field=0.0):
@@ -38,21 +37,22 @@ def plot(weights, temperature, field, N=None, spin=0):
     else:
         weights = weights[:N, :N]
 
-    energies = []
-    probabilities = []
-    states = list(all_states(N))
-    for state in states:
-        spin_state = utils.binary2spin(state)
-        # Compute probability that i'th spin is "on" in the next micro-timestep
-        E = energy(spin, weights, spin_state)
-        energies.append(E)
-        probabilities.append(utils.sigmoid(E, temperature=temperature, field=field))
+    # Evaluate the energies of all states with one matrix-vector product
+    # instead of 2^N Python-level `energy` calls.
+    states = all_states_array(N)
+    spin_states = 2 * states.astype(np.int8) - 1
+    # Compute probability that i'th spin is "on" in the next micro-timestep
+    energies = spin_states @ weights[:, spin]
+    probabilities = utils.sigmoid(energies, temperature=temperature, field=field)
 
     data = pd.DataFrame(
         {
             "energy": energies,
             "probability": probabilities,
-            "state": ["".join(map(str, state)) for state in states],
+            # Reversing the binary rendering of the state index gives the
+            # same little-endian labels as joining each state tuple, with one
+            # string allocation per state instead of N + 1.
+            "state": [f"{i:0{N}b}"[::-1] for i in range(1 << N)],
         }
     )
 
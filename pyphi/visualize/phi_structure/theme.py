@@ -1,6 +1,7 @@
 # visualize/theme.py
 """Provides visual themes."""
 
+from functools import lru_cache
 from inspect import getmro
 from pprint import pformat
 
@@ -8,15 +9,21 @@ from ...data_structures import AttrDeepChainMap
 from ...models import fmt
 
 
+@lru_cache(maxsize=None)
+def _class_defaults(cls):
+    """Return the ``DEFAULTS`` of ``cls`` and its base classes."""
+    return tuple(c.DEFAULTS for c in getmro(cls) if hasattr(c, "DEFAULTS"))
+
+
 class Theme(AttrDeepChainMap):
     """Specifies plot attributes."""
 
     def __init__(self, *maps, **kwargs) -> None:
         # Combine defaults from all base classes to allow easily overriding
-        # certain defaults by subclassing
-        base_classes = getmro(self.__class__)
-        defaults = [cls.DEFAULTS for cls in base_classes if hasattr(cls, "DEFAULTS")]
-        super().__init__(kwargs, *maps, *defaults)
+        # certain defaults by subclassing. The walk over the MRO is cached per
+        # class, since every access to a nested attribute constructs a new
+        # submapping instance.
+        super().__init__(kwargs, *maps, *_class_defaults(self.__class__))
 
     def __repr__(self) -> str:
         body = pformat(self.to_dict())
@@ -40,7 +40,7 @@ def subsys_n1n2():
     return example_networks.subsys_n1n2()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def s_expected_sia():
     with open("./test/data/sia/s.json", mode="rt") as f:
         expected = jsonify.load(f)
@@ -66,7 +66,7 @@ def noisy_selfloop_single():
     return example_networks.noisy_selfloop_single()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def s_noised_expected_sia():
     with open("./test/data/sia/s_noised.json", mode="rt") as f:
         expected = jsonify.load(f)
@@ -111,7 +111,7 @@ def big_subsys_0_thru_3():
     return example_networks.big_subsys_0_thru_3()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def big_subsys_0_thru_3_expected_sia():
     with open("./test/data/sia/big_subsys_0_thru_3.json", mode="rt") as f:
         expected = jsonify.load(f)
@@ -137,7 +137,7 @@ def rule152_s():
     return example_networks.rule152_s()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def rule152_s_expected_sia():
     with open("./test/data/sia/rule152_s.json", mode="rt") as f:
         expected = jsonify.load(f)
@@ -163,7 +163,7 @@ def big_subsys_all_complete():
     return example_networks.big_subsys_all_complete()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def big_subsys_all_complete_expected_sia():
     with open("./test/data/sia/big_subsys_all_complete.json", mode="rt") as f:
         expected = jsonify.load(f)
@@ -194,7 +194,7 @@ def macro_s():
     return example_networks.macro_s()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def macro_s_expected_sia():
     with open("./test/data/sia/macro_s.json", mode="rt") as f:
         expected = jsonify.load(f)
@@ -211,7 +211,7 @@ def micro_s():
     return example_networks.micro_s()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def micro_s_expected_sia():
     with open("./test/data/sia/micro_s.json", mode="rt") as f:
         expected = jsonify.load(f)
@@ -57,79 +57,76 @@ def test_sia_single_micro_nodes_without_selfloops_dont_have_phi(s_single):
     assert s_single.sia().phi == 0.0
 
 
-# s ======================================================
-
-
-@config.override(PARALLEL=False)
-def test_sia_standard_example_sequential(s, s_expected_sia):
-    assert s.sia() == s_expected_sia
-
-
-def test_sia_standard_example_parallel(s, s_expected_sia):
-    assert s.sia() == s_expected_sia
-
-
-def test_sia_standard_example_complete_parallel(s_complete, s_expected_sia):
-    assert s_complete.sia() == s_expected_sia
-
-
-# s_noised ======================================================
-
-
-@config.override(PARALLEL=False)
-def test_sia_noised_example_sequential(s_noised, s_noised_expected_sia):
-    assert s_noised.sia() == s_noised_expected_sia
-
-
-def test_sia_noised_example_parallel(s_noised, s_noised_expected_sia):
-    actual = s_noised.sia()
-    assert actual == s_noised_expected_sia
-
-
-# micro_s ======================================================
-
-
-@config.override(PARALLEL=False)
-def test_sia_micro_sequential(micro_s, micro_s_expected_sia):
-    assert micro_s.sia() == micro_s_expected_sia
-
-
-def test_sia_micro_parallel(micro_s, micro_s_expected_sia):
-    assert micro_s.sia() == micro_s_expected_sia
-
-
-# big_subsys_all_complete ======================================================
-
-
-@pytest.mark.slow
-@config.override(PARALLEL=False)
-def test_sia_big_subsys_all_complete_sequential(
-    big_subsys_all_complete, big_subsys_all_complete_expected_sia
-):
-    assert big_subsys_all_complete.sia() == big_subsys_all_complete_expected_sia
-
-
-@pytest.mark.slow
-def test_sia_big_subsys_all_complete_parallel(
-    big_subsys_all_complete, big_subsys_all_complete_expected_sia
-):
-    assert big_subsys_all_complete.sia() == big_subsys_all_complete_expected_sia
-
-
-# big_subsys_0_thru_3 ======================================================
-
-
-@config.override(PARALLEL=False)
-def test_sia_big_network_0_thru_3_sequential(
-    big_subsys_0_thru_3, big_subsys_0_thru_3_expected_sia
-):
-    assert big_subsys_0_thru_3.sia() == big_subsys_0_thru_3_expected_sia
-
-
-def test_sia_big_network_0_thru_3_parallel(
-    big_subsys_0_thru_3, big_subsys_0_thru_3_expected_sia
-):
-    assert big_subsys_0_thru_3.sia() == big_subsys_0_thru_3_expected_sia
+# Example networks, sequential vs. parallel ====================================
+
+
+@pytest.mark.parametrize(
+    "subsystem,expected,parallel",
+    [
+        (pytest.lazy_fixture("s"), pytest.lazy_fixture("s_expected_sia"), False),
+        (pytest.lazy_fixture("s"), pytest.lazy_fixture("s_expected_sia"), True),
+        (
+            pytest.lazy_fixture("s_complete"),
+            pytest.lazy_fixture("s_expected_sia"),
+            True,
+        ),
+        (
+            pytest.lazy_fixture("s_noised"),
+            pytest.lazy_fixture("s_noised_expected_sia"),
+            False,
+        ),
+        (
+            pytest.lazy_fixture("s_noised"),
+            pytest.lazy_fixture("s_noised_expected_sia"),
+            True,
+        ),
+        (
+            pytest.lazy_fixture("micro_s"),
+            pytest.lazy_fixture("micro_s_expected_sia"),
+            False,
+        ),
+        (
+            pytest.lazy_fixture("micro_s"),
+            pytest.lazy_fixture("micro_s_expected_sia"),
+            True,
+        ),
+        pytest.param(
+            pytest.lazy_fixture("big_subsys_all_complete"),
+            pytest.lazy_fixture("big_subsys_all_complete_expected_sia"),
+            False,
+            marks=pytest.mark.slow,
+        ),
+        pytest.param(
+            pytest.lazy_fixture("big_subsys_all_complete"),
+            pytest.lazy_fixture("big_subsys_all_complete_expected_sia"),
+            True,
+            marks=pytest.mark.slow,
+        ),
+        (
+            pytest.lazy_fixture("big_subsys_0_thru_3"),
+            pytest.lazy_fixture("big_subsys_0_thru_3_expected_sia"),
+            False,
+        ),
+        (
+            pytest.lazy_fixture("big_subsys_0_thru_3"),
+            pytest.lazy_fixture("big_subsys_0_thru_3_expected_sia"),
+            True,
+        ),
+        (
+            pytest.lazy_fixture("macro_s"),
+            pytest.lazy_fixture("macro_s_expected_sia"),
+            False,
+        ),
+        (
+            pytest.lazy_fixture("macro_s"),
+            pytest.lazy_fixture("macro_s_expected_sia"),
+            True,
+        ),
+    ],
+)
+def test_sia_example_networks(subsystem, expected, parallel):
+    with config.override(PARALLEL=parallel):
+        assert subsystem.sia() == expected
 
 
 # rule152_s ======================================================
@@ -137,26 +134,10 @@ def test_sia_big_network_0_thru_3_parallel(
 
 
 @pytest.mark.veryslow
-@config.override(PARALLEL=False)
-def test_sia_rule152_s_sequential(rule152_s, rule152_s_expected_sia):
-    assert rule152_s.sia().phi == rule152_s_expected_sia.phi
-
-
-@pytest.mark.veryslow
-def test_sia_rule152_s_parallel(rule152_s, rule152_s_expected_sia):
-    assert rule152_s.sia().phi == rule152_s_expected_sia.phi
-
-
-# macro_s ======================================================
-
-
-@config.override(PARALLEL=False)
-def test_sia_macro_sequential(macro_s, macro_s_expected_sia):
-    assert macro_s.sia() == macro_s_expected_sia
-
-
-def test_sia_macro_parallel(macro_s, macro_s_expected_sia):
-    assert macro_s.sia() == macro_s_expected_sia
+@pytest.mark.parametrize("parallel", [False, True])
+def test_sia_rule152_s(parallel, rule152_s, rule152_s_expected_sia):
+    with config.override(PARALLEL=parallel):
+        assert rule152_s.sia().phi == rule152_s_expected_sia.phi
 
 
 # ======================================================
@@ -217,14 +198,34 @@ def test_ces_concepts_share_the_same_subsystem(parallel, s):
 """
 
 
-@pytest.mark.slow
-def test_parallel_and_sequential_ces_are_equal(s, micro_s, macro_s):
-    with config.override(PARALLEL=False):
-        c = compute.subsystem.ces(s)
-        c_micro = compute.subsystem.ces(micro_s)
-        c_macro = compute.subsystem.ces(macro_s)
+@pytest.fixture(scope="session")
+def sequential_ces():
+    """Compute the sequential CES of a subsystem once per session.
+
+    Keyed on the subsystem itself, so equal subsystems from different
+    parametrizations (or tests) share one ground-truth computation.
+    """
+    computed = {}
+
+    def _sequential_ces(subsystem):
+        if subsystem not in computed:
+            with config.override(PARALLEL=False):
+                computed[subsystem] = compute.subsystem.ces(subsystem)
+        return computed[subsystem]
 
+    return _sequential_ces
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize(
+    "subsystem",
+    [
+        pytest.lazy_fixture("s"),
+        pytest.lazy_fixture("micro_s"),
+        pytest.lazy_fixture("macro_s"),
+    ],
+)
+def test_parallel_and_sequential_ces_are_equal(sequential_ces, subsystem):
+    expected = sequential_ces(subsystem)
     with config.override(PARALLEL=True):
-        assert set(c) == set(compute.subsystem.ces(s))
-        assert set(c_micro) == set(compute.subsystem.ces(micro_s))
-        assert set(c_macro) == set(compute.subsystem.ces(macro_s))
+        assert set(expected) == set(compute.subsystem.ces(subsystem))
@@ -1,11 +1,4 @@
-import functools
-import multiprocessing
-from unittest import mock
-
-import pytest
-import redis
-
-from pyphi import Direction, Subsystem, cache, config, examples, models
+from pyphi import Direction, cache, config
 
 
 def test_cache():
@@ -57,36 +50,24 @@ def test_cache_key_generation():
     assert c.key("arg", _prefix="CONSTANT") == ("CONSTANT", "arg")
 
 
-def factory():
-    """This function is necessary because CACHE_REPERTOIRES does not have an
-    effect if changed at runtime.
-
-    .. TODO:
-        fix that
-    """
-
-    class SomeObject:
-        """Object for testing CACHE_REPERTOIRES config option"""
+class ObjectWithRepertoires:
+    """Object for testing CACHE_REPERTOIRES config option"""
 
-        def __init__(self):
-            self.repertoire_cache = cache.DictCache()
-
-        @cache.method("repertoire_cache", "cause")
-        def cause_repertoire(self, some_arg):
-            return "expensive computation"
+    def __init__(self):
+        self.repertoire_cache = cache.DictCache()
 
-        @cache.method("repertoire_cache", "effect")
-        def effect_repertoire(self, some_arg):
-            return "expensive computation"
+    @cache.method("repertoire_cache", "cause")
+    def cause_repertoire(self, some_arg):
+        return "expensive computation"
 
-    return SomeObject
+    @cache.method("repertoire_cache", "effect")
+    def effect_repertoire(self, some_arg):
+        return "expensive computation"
 
 
 def test_cache_repertoires_config_option():
-
     with config.override(CACHE_REPERTOIRES=True):
-        SomeObject = factory()
-        o = SomeObject()
+        o = ObjectWithRepertoires()
         assert o.cause_repertoire(1) == "expensive computation"
         assert o.effect_repertoire(1) == "expensive computation"
         expected_key = ("cause", 1)
@@ -95,14 +76,24 @@ def test_cache_repertoires_config_option():
         assert expected_key in o.repertoire_cache.cache
 
     with config.override(CACHE_REPERTOIRES=False):
-        SomeObject = factory()
-        o = SomeObject()
+        o = ObjectWithRepertoires()
         assert o.cause_repertoire(1) == "expensive computation"
         assert o.effect_repertoire(1) == "expensive computation"
         # Repertoire cache should be empty
         assert not o.repertoire_cache.cache
 
 
+def test_cache_repertoires_respected_at_runtime():
+    """The option takes effect immediately, even on existing instances."""
+    o = ObjectWithRepertoires()
+    with config.override(CACHE_REPERTOIRES=False):
+        o.cause_repertoire(1)
+        assert not o.repertoire_cache.cache
+    with config.override(CACHE_REPERTOIRES=True):
+        o.cause_repertoire(1)
+        assert ("cause", 1) in o.repertoire_cache.cache
+
+
 
 # Test purview cache
 # ==================
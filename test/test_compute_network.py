@@ -1,5 +1,6 @@
 import pickle
 
+import numpy as np
 import pytest
 
 from pyphi import Network, Subsystem, compute, config, constants, utils
@@ -43,53 +44,40 @@ def test_all_complexes_parallelization(s):
     assert sorted(serial) == sorted(parallel)
 
 
-# TODO fix this horribly outdated mess that never worked in the first place :P
-@pytest.mark.veryslow
-@pytest.mark.outdated
-def test_rule152_complexes_no_caching(rule152):
-    net = rule152
-    # Mapping from index of a PyPhi subsystem in network.subsystems to the
-    # index of the corresponding subsystem in the Matlab list of subsets
-    perm = {
-        0: 0,
-        1: 1,
-        2: 3,
-        3: 7,
-        4: 15,
-        5: 2,
-        6: 4,
-        7: 8,
-        8: 16,
-        9: 5,
-        10: 9,
-        11: 17,
-        12: 11,
-        13: 19,
-        14: 23,
-        15: 6,
-        16: 10,
-        17: 18,
-        18: 12,
-        19: 20,
-        20: 24,
-        21: 13,
-        22: 21,
-        23: 25,
-        24: 27,
-        25: 14,
-        26: 22,
-        27: 26,
-        28: 28,
-        29: 29,
-        30: 30,
-    }
+# Mapping from index of a PyPhi subsystem in network.subsystems to the
+# index of the corresponding subsystem in the Matlab list of subsets
+RULE152_PERM = np.array(
+    # fmt: off
+    [
+         0,  1,  3,  7, 15,  2,  4,  8, 16,  5,  9, 17, 11, 19, 23, 6,
+        10, 18, 12, 20, 24, 13, 21, 25, 27, 14, 22, 26, 28, 29, 30,
+    ]
+    # fmt: on
+)
+
+
+@pytest.fixture(scope="session")
+def rule152_results():
+    """The Matlab-generated rule152 results, loaded once per session.
+
+    Each per-subsystem phi list is pre-converted to an array so tests can
+    compare whole permuted phi vectors in one call.
+    """
     with open("test/data/rule152_results.pkl", "rb") as f:
         results = pickle.load(f)
+    for result in results.values():
+        result["subsystem_phis"] = np.asarray(result["subsystem_phis"])
+    return results
+
 
+# TODO fix this horribly outdated mess that never worked in the first place :P
+@pytest.mark.veryslow
+@pytest.mark.outdated
+def test_rule152_complexes_no_caching(rule152, rule152_results):
     # Don't use concept caching for this test.
     constants.CACHE_CONCEPTS = False
 
-    for state, result in results.items():
+    for state, result in rule152_results.items():
         # Unpack the state from the results key.
         # Generate the network with the state we're testing.
         net = Network(rule152.tpm, state, cm=rule152.cm)
@@ -97,17 +85,15 @@ def test_rule152_complexes_no_caching(rule152):
         # since Matlab doesn't include it in results.
         complexes = list(compute.network.complexes(net))[1:]
         # Check the phi values of all complexes.
-        zz = [
-            (sia.phi, result["subsystem_phis"][perm[i]])
-            for i, sia in list(enumerate(complexes))
-        ]
-        diff = [
-            utils.eq(sia.phi, result["subsystem_phis"][perm[i]])
-            for i, sia in list(enumerate(complexes))
-        ]
-        assert all(
-            utils.eq(sia.phi, result["subsystem_phis"][perm[i]])
-            for i, sia in list(enumerate(complexes))[:]
+        actual_phis = np.array([sia.phi for sia in complexes])
+        expected_phis = result["subsystem_phis"][RULE152_PERM[: len(complexes)]]
+        epsilon = 10 ** (-config.PRECISION)
+        close = np.isclose(actual_phis, expected_phis, rtol=epsilon, atol=epsilon)
+        # On failure, report every mismatching complex at once.
+        assert close.all(), (
+            np.flatnonzero(~close),
+            actual_phis[~close],
+            expected_phis[~close],
         )
         # Check the major complex in particular.
         major = compute.subsystem.major_complex(net)
@@ -120,13 +106,15 @@ def test_rule152_complexes_no_caching(rule152):
         )
         # Check that the concept's phi values are the same.
         result_concepts = [c for c in result["concepts"] if c["is_irreducible"]]
-        z = list(zip([c.phi for c in major.ces], [c["phi"] for c in result_concepts]))
-        diff = [i for i in range(len(z)) if not utils.eq(z[i][0], z[i][1])]
-        assert all(
-            list(
-                utils.eq(c.phi, result_concepts[i]["phi"])
-                for i, c in enumerate(major.ces)
-            )
+        actual_concept_phis = np.array([c.phi for c in major.ces])
+        expected_concept_phis = np.array([c["phi"] for c in result_concepts])
+        close = np.isclose(
+            actual_concept_phis, expected_concept_phis, rtol=epsilon, atol=epsilon
+        )
+        assert close.all(), (
+            np.flatnonzero(~close),
+            actual_concept_phis[~close],
+            expected_concept_phis[~close],
         )
         # Check that the minimal cut is the same.
         assert major.cut == result["cut"]